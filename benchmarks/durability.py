@@ -0,0 +1,77 @@
+"""
+Benchmark the cost of each durability mode when copying a batch of small screenshots.
+
+usage: python -m benchmarks.durability [--files=1000] [--size=65536] [--runs=3]
+"""
+
+# Standard Library
+import os
+import shutil
+import statistics
+import tempfile
+import time
+
+# Third party
+import fire
+from rich.console import Console
+from rich.table import Table
+
+# shot
+from shot import Shot, durability_modes
+
+
+def _make_screenshots(src_dir: str, files: int, size: int) -> None:
+    for i in range(files):
+        with open(os.path.join(src_dir, f"Screenshot {i}.png"), "wb") as f:
+            f.write(os.urandom(size))
+
+
+def _time_copy(src_dir: str, tmp_dir: str, files: int, durability: str) -> float:
+    dst_dir = tempfile.mkdtemp(dir=tmp_dir)
+    shot = Shot(src=src_dir, dst=dst_dir, num=files, quiet=True, durability=durability)
+    # start every run from a clean cache, otherwise a mode that syncs pays to write out
+    # whatever earlier runs left dirty e.g. all the files copied with durability=none.
+    os.sync()
+    start = time.perf_counter()
+    shot()
+    seconds = time.perf_counter() - start
+    shutil.rmtree(dst_dir)
+    return seconds
+
+
+def benchmark(files: int = 1000, size: int = 64 * 1024, runs: int = 3, tmp_dir: str = None):
+    """
+    Args:
+        files:   number of screenshots per batch.                 Default: 1000
+        size:    size of each screenshot in bytes.                Default: 65536
+        runs:    number of batches to time per mode.              Default: 3
+        tmp_dir: directory to benchmark in, should be on the disk
+                 you care about. If None use the system temp dir. Default: None
+    """
+    console = Console()
+    table = Table(title=f"cp {files} files of {size} bytes, median of {runs} runs")
+    table.add_column("durability")
+    table.add_column("seconds", justify="right")
+    table.add_column("files/s", justify="right")
+    table.add_column("vs none", justify="right")
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as root:
+        src_dir = os.path.join(root, "src")
+        os.mkdir(src_dir)
+        _make_screenshots(src_dir, files, size)
+
+        baseline = None
+        for durability in durability_modes:
+            seconds = statistics.median(
+                _time_copy(src_dir, root, files, durability) for _ in range(runs)
+            )
+            baseline = baseline or seconds
+            table.add_row(
+                durability, f"{seconds:.3f}", f"{files / seconds:.0f}", f"{seconds / baseline:.1f}x"
+            )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    fire.Fire(benchmark)
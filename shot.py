@@ -1,9 +1,12 @@
 # Standard Library
+import errno
+import fcntl
 import glob
 import os
 import shutil
 import subprocess
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Set
 
 # Third party
 import fire
@@ -11,6 +14,7 @@ from rich.console import Console
 from rich.prompt import Prompt
 
 commands = {"cp": "Copied", "mv": "Moved"}
+durability_modes = ["none", "batch", "strict"]
 __version__ = "2.0.2"
 
 
@@ -28,6 +32,7 @@ class Shot:
         color:    toggle color output.                                            Default: True
         quiet:    quiet mode, print less things to the console.                   Default: False
         dry_run:  if True show an equivalent bash command that would be run.      Default: False
+        durability: fsync files. none, batch (at end), strict (per file).         Default: none
         debug:    if True raise error with full stack trace, else print warning.  Default: False
         encoding: encoding to use for shell.                                      Default: utf-8
         version:  if True show version, else run shot.                            Default: False
@@ -44,6 +49,7 @@ class Shot:
         color: bool = True,
         quiet: bool = False,
         dry_run: bool = False,
+        durability: str = "none",
         debug: bool = False,
         encoding: str = "utf-8",
         version: bool = False,
@@ -57,6 +63,7 @@ class Shot:
         self.color = color
         self.quiet = quiet
         self.dry_run = dry_run
+        self.durability = durability
         self.debug = debug
         self.encoding = encoding
         self.version = version
@@ -125,8 +132,60 @@ class Shot:
             err_msg += f"start must be > 0. got:{self.start}\n"
         if self.num < 1:
             err_msg += f"num must be > 0. got:{self.num}\n"
+        if self.durability not in durability_modes:
+            err_msg += f"durability must be one of {durability_modes}. got:{self.durability}\n"
         return err_msg
 
+    def _fsync(self, path: str, full: bool = False) -> None:
+        """
+        flush file or directory at path to the drive.
+        on OSX fsync only reaches the drive's cache, full=True uses F_FULLFSYNC to flush that too.
+        F_FULLFSYNC flushes the whole cache, not just path, so it only needs to run once per sync.
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            if full:
+                try:
+                    fcntl.fcntl(fd, fcntl.F_FULLFSYNC)  # type: ignore
+                    return
+                except AttributeError:
+                    pass  # not OSX
+                except OSError as e:
+                    # only fall back if the filesystem doesn't support F_FULLFSYNC.
+                    # anything else e.g. EIO means the data may not be on disk, so don't hide it.
+                    if e.errno not in (errno.ENOTSUP, errno.EINVAL, errno.ENOTTY):
+                        raise
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _parent_dirs(self, paths: Iterable[str]) -> Set[str]:
+        """
+        return directories whose entries changed when writing paths.
+        mv also removes entries from the screenshot dir, so it needs syncing too.
+        """
+        dirs = {os.path.dirname(os.path.abspath(path)) for path in paths}
+        if self.mv:
+            dirs.add(os.path.abspath(self.screenshot_dir_parsed))
+        return dirs
+
+    def _sync(self, paths: List[str]) -> None:
+        """
+        fsync files first, then their directories, so new entries never point at unflushed data.
+        files are synced concurrently, each directory is synced once no matter how many files it has.
+        finally flush the drive cache once, via the directory of the last file, to commit them all.
+        """
+        if len(paths) > 1:
+            with ThreadPoolExecutor() as executor:
+                list(executor.map(self._fsync, paths))  # list to raise any errors
+        else:
+            for path in paths:
+                self._fsync(path)
+        last_dir = os.path.dirname(os.path.abspath(paths[-1]))
+        for directory in sorted(self._parent_dirs(paths) - {last_dir}):
+            self._fsync(directory)
+        self._fsync(last_dir, full=True)
+
     def _valid_screenshots_to_copy(self):
         if len(self.screenshots_to_copy) < 1:
             self.console.print(f"No files found in {self.screenshot_dir_parsed}", style="red")
@@ -172,14 +231,22 @@ class Shot:
             return equivalent_command
 
         try:
-            for screenshot_to_copy in self.screenshots_to_copy:
-                if not self._can_run_op(screenshot_to_copy):
-                    return
-                if cmd == "cp":
-                    shutil.copy(screenshot_to_copy, self.dst)
-                elif cmd == "mv":
-                    shutil.move(screenshot_to_copy, self.dst)
-                # no need for else, should be handled above by `if cmd not in accepted_cmds:`
+            written = []
+            try:
+                for screenshot_to_copy in self.screenshots_to_copy:
+                    if not self._can_run_op(screenshot_to_copy):
+                        return
+                    if cmd == "cp":
+                        written.append(shutil.copy(screenshot_to_copy, self.dst))
+                    elif cmd == "mv":
+                        written.append(shutil.move(screenshot_to_copy, self.dst))
+                    # no need for else, should be handled above by `if cmd not in accepted_cmds:`
+                    if self.durability == "strict":
+                        self._sync(written[-1:])
+            finally:
+                # sync files already written even if the user said no or an op failed part way
+                if self.durability == "batch" and written:
+                    self._sync(written)
             if not self.quiet:
                 screenshot_names = [os.path.basename(v) for v in self.screenshots_to_copy]
                 self.console.print(
@@ -96,6 +96,27 @@ def test_cp_multiple(tmp_path):
     assert os.path.exists(expected_output_path_two) == True
 
 
+@pytest.mark.parametrize("durability", ["batch", "strict"])
+def test_cp_multiple_durable(tmp_path, durability):
+    """
+    files should be copied and synced to disk without errors
+    """
+    src_dir, dst_dir, src_file = setup_dirs(tmp_path, nfiles=2)
+    Shot(src=str(src_dir), dst=str(dst_dir), num=2, durability=durability)()
+    assert (dst_dir / "foo1.txt").read_text() == "foo1"
+    assert (dst_dir / "foo2.txt").read_text() == "foo2"
+
+
+def test_mv_to_file_durable(tmp_path):
+    src_dir, dst_dir, src_file = setup_dirs(tmp_path)
+    expected_output_path = dst_dir / "bar.txt"
+    s = Shot(src=str(src_dir), dst=str(expected_output_path), mv=True, durability="strict")
+    s._confirm = lambda: True  # avoid capturing stdin during test
+    s()
+    assert os.path.exists(src_file) == False
+    assert expected_output_path.read_text() == "foo1"
+
+
 # error handling
 def test_cp_file_exists(tmp_path):
     """
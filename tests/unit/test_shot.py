@@ -1,4 +1,5 @@
 # Standard Library
+import errno
 import unittest
 from unittest.mock import MagicMock, call, patch
 
@@ -233,6 +234,150 @@ class TestShot(unittest.TestCase):
         check_output_mock.assert_has_calls(check_output_calls)
         copy_mock.assert_has_calls(copy_mock_calls)
 
+    @patch("glob.glob")
+    @patch("shutil.copy")
+    @patch("subprocess.check_output")
+    def test_durability_batch(self, check_output_mock, copy_mock, glob_mock):
+        """
+        should fsync every copied file, then the destination directory once
+        """
+        check_output_mock.side_effect = [b"/tmp/tests\n"]
+        glob_mock.side_effect = [["/tmp/tests/1", "/tmp/tests/2"]]
+        copy_mock.side_effect = ["/tmp/output/1", "/tmp/output/2"]
+
+        s = Shot(num=2, dst="/tmp/output", durability="batch")
+        s.console.print = MagicMock()
+        s._fsync = MagicMock()
+        s()
+        fsynced = [c.args[0] for c in s._fsync.call_args_list]
+        assert sorted(fsynced[:2]) == ["/tmp/output/1", "/tmp/output/2"]
+        assert fsynced[2:] == ["/tmp/output"]
+        s._fsync.assert_called_with("/tmp/output", full=True)
+
+    @patch("glob.glob")
+    @patch("shutil.move")
+    @patch("subprocess.check_output")
+    def test_durability_strict(self, check_output_mock, move_mock, glob_mock):
+        """
+        should fsync each moved file and both directories after every move
+        """
+        check_output_mock.side_effect = [b"/tmp/tests\n"]
+        glob_mock.side_effect = [["/tmp/tests/1", "/tmp/tests/2"]]
+        move_mock.side_effect = ["/tmp/output/1", "/tmp/output/2"]
+
+        s = Shot(num=2, dst="/tmp/output", mv=True, durability="strict")
+        s.console.print = MagicMock()
+        s._fsync = MagicMock()
+        s()
+        s._fsync.assert_has_calls(
+            [
+                call("/tmp/output/1"),
+                call("/tmp/tests"),
+                call("/tmp/output", full=True),
+                call("/tmp/output/2"),
+                call("/tmp/tests"),
+                call("/tmp/output", full=True),
+            ]
+        )
+
+    @patch("glob.glob")
+    @patch("shutil.copy")
+    @patch("subprocess.check_output")
+    def test_durability_batch_declined(self, check_output_mock, copy_mock, glob_mock):
+        """
+        should fsync files already copied if the user stops part way through
+        """
+        check_output_mock.side_effect = [b"/tmp/tests\n"]
+        glob_mock.side_effect = [["/tmp/tests/1", "/tmp/tests/2"]]
+        copy_mock.side_effect = ["/tmp/output/1"]
+
+        s = Shot(num=2, dst="/tmp/output", durability="batch")
+        s.console.print = MagicMock()
+        s._can_run_op = MagicMock(side_effect=[True, False])
+        s._fsync = MagicMock()
+        s()
+        copy_mock.assert_called_once_with("/tmp/tests/1", "/tmp/output")
+        assert s._fsync.call_args_list == [call("/tmp/output/1"), call("/tmp/output", full=True)]
+        s.console.print.assert_not_called()
+
+    @patch("glob.glob")
+    @patch("shutil.copy")
+    @patch("subprocess.check_output")
+    def test_durability_batch_failed(self, check_output_mock, copy_mock, glob_mock):
+        """
+        should fsync files already copied before exiting if a later copy fails
+        """
+        check_output_mock.side_effect = [b"/tmp/tests\n"]
+        glob_mock.side_effect = [["/tmp/tests/1", "/tmp/tests/2"]]
+        copy_mock.side_effect = ["/tmp/output/1", PermissionError("denied")]
+
+        s = Shot(num=2, dst="/tmp/output", durability="batch")
+        s.console.print = MagicMock()
+        s._fsync = MagicMock()
+        with pytest.raises(SystemExit):
+            s()
+        assert s._fsync.call_args_list == [call("/tmp/output/1"), call("/tmp/output", full=True)]
+        s.console.print.assert_called_with(
+            "cp /tmp/tests/1 /tmp/tests/2 /tmp/output failed", style="red"
+        )
+
+    @patch("glob.glob")
+    @patch("shutil.copy")
+    @patch("subprocess.check_output")
+    def test_durability_none(self, check_output_mock, copy_mock, glob_mock):
+        """
+        should not fsync anything by default
+        """
+        check_output_mock.side_effect = [b"/tmp/tests\n"]
+        glob_mock.side_effect = [["/tmp/tests/first"]]
+
+        s = Shot()
+        s.console.print = MagicMock()
+        s._fsync = MagicMock()
+        s()
+        s._fsync.assert_not_called()
+
+    @patch("glob.glob")
+    @patch("shutil.copy")
+    @patch("subprocess.check_output")
+    @patch("os.close")
+    @patch("os.fsync")
+    @patch("os.open")
+    @patch("fcntl.F_FULLFSYNC", 51, create=True)
+    @patch("fcntl.fcntl")
+    def test_durability_full_fsync_count(
+        self, fcntl_mock, open_mock, fsync_mock, close_mock, check_output_mock, copy_mock, glob_mock
+    ):
+        """
+        batch should flush the drive cache once for all files, strict once per file
+        """
+        screenshots = ["/tmp/tests/1", "/tmp/tests/2", "/tmp/tests/3"]
+        for durability, full_fsyncs in [("batch", 1), ("strict", 3)]:
+            fcntl_mock.reset_mock()
+            check_output_mock.side_effect = [b"/tmp/tests\n"]
+            glob_mock.side_effect = [screenshots]
+            copy_mock.side_effect = ["/tmp/output/1", "/tmp/output/2", "/tmp/output/3"]
+
+            s = Shot(num=3, dst="/tmp/output", durability=durability)
+            s.console.print = MagicMock()
+            s()
+            assert fcntl_mock.call_count == full_fsyncs, durability
+
+    @patch("os.close")
+    @patch("os.fsync")
+    @patch("os.open")
+    @patch("fcntl.F_FULLFSYNC", 51, create=True)
+    @patch("fcntl.fcntl")
+    def test_fsync_full_fsync_not_supported(self, fcntl_mock, open_mock, fsync_mock, close_mock):
+        """
+        should fall back to fsync if the filesystem doesn't support F_FULLFSYNC
+        """
+        fcntl_mock.side_effect = OSError(errno.ENOTSUP, "Operation not supported")
+        open_mock.return_value = 3
+        Shot()._fsync("/tmp/output/1", full=True)
+        fsync_mock.assert_called_once_with(3)
+        close_mock.assert_called_once_with(3)
+
 
 class TestShotErrorHandling(unittest.TestCase):
     def test_src(self):
@@ -263,6 +408,14 @@ class TestShotErrorHandling(unittest.TestCase):
         s()
         s.console.print.assert_called_with("num must be > 0. got:0\n", style="red")
 
+    def test_durability(self):
+        s = Shot(durability="sometimes")
+        s.console.print = MagicMock()
+        s()
+        s.console.print.assert_called_with(
+            "durability must be one of ['none', 'batch', 'strict']. got:sometimes\n", style="red"
+        )
+
     def test_multiple_errors(self):
         """
         should show all errors together. don't make user find them one by one.
@@ -277,3 +430,20 @@ class TestShotErrorHandling(unittest.TestCase):
             "src must be a directory. got:foo\nstart must be > 0. got:0\nnum must be > 0. got:0\n",
             style="red",
         )
+
+    @patch("os.close")
+    @patch("os.fsync")
+    @patch("os.open")
+    @patch("fcntl.F_FULLFSYNC", 51, create=True)
+    @patch("fcntl.fcntl")
+    def test_fsync_io_error(self, fcntl_mock, open_mock, fsync_mock, close_mock):
+        """
+        should raise write-back errors from F_FULLFSYNC instead of retrying with fsync
+        """
+        fcntl_mock.side_effect = OSError(errno.EIO, "Input/output error")
+        open_mock.return_value = 3
+        with pytest.raises(OSError) as context:
+            Shot()._fsync("/tmp/output/1", full=True)
+        assert context.value.errno == errno.EIO
+        fsync_mock.assert_not_called()
+        close_mock.assert_called_once_with(3)